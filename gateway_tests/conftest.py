@@ -15,6 +15,7 @@ Environment variables used:
 """
 
 import contextlib
+import copy
 import dataclasses
 import enum
 import functools
@@ -29,8 +30,9 @@ import textwrap
 import threading
 import time
 from collections import defaultdict
-from concurrent.futures import ProcessPoolExecutor
-from typing import Any, ContextManager, Generator, Iterable, Optional, Protocol
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (Any, Callable, Collection, ContextManager, Generator,
+                    Iterable, Optional, Protocol)
 
 import pytest
 
@@ -59,6 +61,8 @@ libca_so = os.path.join(
 if "PYEPICS_LIBCA" not in os.environ and os.path.exists(libca_so):
     os.environ["PYEPICS_LIBCA"] = libca_so
 
+PROP_SUPPORT_CACHE_KEY = "gateway_tests/prop_supported"
+
 # CA ports to use
 default_ioc_port = 62782
 default_gw_port = 62783
@@ -198,6 +202,39 @@ def run_process(
         logger.info("Process %s exited", cmd[0])
 
 
+@contextlib.contextmanager
+def run_concurrently(*managers: ContextManager) -> ContextManager[tuple]:
+    """
+    Enter several context managers concurrently.
+
+    This is used to start independent processes, such as the IOC and the
+    gateway, without waiting for each to be ready in turn.  The managers
+    are exited in reverse order, as with nested ``with`` statements.
+
+    Yields
+    ------
+    results : tuple
+        The values yielded by each of ``managers``, in order.
+    """
+    with contextlib.ExitStack() as stack:
+        with ThreadPoolExecutor(max_workers=len(managers)) as executor:
+            futures = [executor.submit(manager.__enter__) for manager in managers]
+
+        results = []
+        error = None
+        for manager, future in zip(managers, futures):
+            try:
+                results.append(future.result())
+            except BaseException as ex:
+                error = error or ex
+            else:
+                stack.push(manager.__exit__)
+
+        if error is not None:
+            raise error
+        yield tuple(results)
+
+
 @contextlib.contextmanager
 def run_ioc(
     *arglist: str,
@@ -215,7 +252,7 @@ def run_ioc(
         Extra arguments to pass to the IOC process.
 
     startup_time : float, optional
-        Time to wait for the IOC to be ready.
+        Maximum time to wait for the IOC to be ready.
 
     db_file : str, optional
         Path to the IOC database.  Defaults to ``test_ioc_db``.
@@ -227,14 +264,19 @@ def run_ioc(
     ioc_port : int, optional
         The IOC port number to listen on - defaults to ``default_ioc_port``.
     """
-    env = dict(os.environ)
-    env["EPICS_CA_SERVER_PORT"] = str(ioc_port)
-    env["EPICS_CA_ADDR_LIST"] = "localhost"
-    env["EPICS_CA_AUTO_ADDR_LIST"] = "NO"
-    # IOC_ environment overrides
-    for v in list(os.environ.keys()):
-        if v.startswith("IOC_"):
-            env[v.replace("IOC_", "", 1)] = os.environ[v]
+    environ = dict(os.environ)
+    env = {
+        **environ,
+        "EPICS_CA_SERVER_PORT": str(ioc_port),
+        "EPICS_CA_ADDR_LIST": "localhost",
+        "EPICS_CA_AUTO_ADDR_LIST": "NO",
+        # IOC_ environment overrides
+        **{
+            key[len("IOC_"):]: value
+            for key, value in environ.items()
+            if key.startswith("IOC_")
+        },
+    }
 
     cmd = [ioc_executable]
     if dbd_file is not None:
@@ -246,7 +288,12 @@ def run_ioc(
     cmd.extend(arglist)
 
     with run_process(
-        cmd, env, verbose=verbose, interactive=True, wait_for=b"epics>"
+        cmd,
+        env,
+        verbose=verbose,
+        interactive=True,
+        startup_time=startup_time,
+        wait_for=b"epics>",
     ) as proc:
         yield proc
 
@@ -260,6 +307,7 @@ def run_gateway(
     gateway_port: int = default_gw_port,
     verbose: bool = verbose_gateway,
     stats_prefix: str = "gwtest",
+    startup_time: float = 0.5,
 ) -> ContextManager[subprocess.Popen]:
     """
     Starts a gateway process with the provided configuration.
@@ -286,6 +334,9 @@ def run_gateway(
 
     stats_prefix : str, optional
         Gateway statistics PV prefix.
+
+    startup_time : float, optional
+        Maximum time to wait for the gateway to be ready.
     """
     cmd = [
         gateway_executable,
@@ -304,7 +355,12 @@ def run_gateway(
         cmd.extend(["-debug", str(gateway_debug_level)])
 
     with run_process(
-        cmd, os.environ, verbose=verbose, interactive=False, wait_for=b"Running as user"
+        cmd,
+        os.environ,
+        verbose=verbose,
+        interactive=False,
+        startup_time=startup_time,
+        wait_for=b"Running as user",
     ) as proc:
         yield proc
 
@@ -338,44 +394,65 @@ def local_channel_access(
             )
         )
 
-    with context_set_env("EPICS_CA_AUTO_ADDR_LIST", "NO"):
-        with context_set_env("EPICS_CA_ADDR_LIST", address_list):
-            epics.ca.initialize_libca()
-            try:
-                yield
-            finally:
-                # This may lead to instability - probably should only run one
-                # test per process
-                epics.ca.clear_cache()
-                epics.ca.finalize_libca()
+    with context_set_envs(
+        EPICS_CA_AUTO_ADDR_LIST="NO",
+        EPICS_CA_ADDR_LIST=address_list,
+    ):
+        epics.ca.initialize_libca()
+        try:
+            yield
+        finally:
+            # This may lead to instability - probably should only run one
+            # test per process
+            epics.ca.clear_cache()
+            epics.ca.finalize_libca()
 
 
 @contextlib.contextmanager
-def context_set_env(key: str, value: Any):
-    """Context manager to set - and then reset - an environment variable."""
-    orig_value = os.environ.get(key, None)
+def context_set_envs(**values: Any):
+    """
+    Context manager to set - and then reset - several environment variables.
+
+    Variables which were not originally set are removed on exit.  Yields a
+    dictionary of the original values, with None for those that were unset.
+    """
+    orig_values = {key: os.environ.get(key, None) for key in values}
     try:
-        os.environ[key] = str(value)
-        yield orig_value
+        os.environ.update({key: str(value) for key, value in values.items()})
+        yield orig_values
     finally:
-        if orig_value is not None:
-            os.environ[key] = orig_value
+        for key, orig_value in orig_values.items():
+            if orig_value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = orig_value
+
+
+@contextlib.contextmanager
+def context_set_env(key: str, value: Any):
+    """Context manager to set - and then reset - an environment variable."""
+    with context_set_envs(**{key: value}) as orig_values:
+        yield orig_values[key]
 
 
 @contextlib.contextmanager
 def gateway_channel_access_env():
     """Set the environment up for communication solely with the spawned gateway."""
-    with context_set_env("EPICS_CA_AUTO_ADDR_LIST", "NO"):
-        with context_set_env("EPICS_CA_ADDR_LIST", f"localhost:{default_gw_port}"):
-            yield
+    with context_set_envs(
+        EPICS_CA_AUTO_ADDR_LIST="NO",
+        EPICS_CA_ADDR_LIST=f"localhost:{default_gw_port}",
+    ):
+        yield
 
 
 @contextlib.contextmanager
 def ioc_channel_access_env():
     """Set the environment up for communication solely with the spawned IOC."""
-    with context_set_env("EPICS_CA_AUTO_ADDR_LIST", "NO"):
-        with context_set_env("EPICS_CA_ADDR_LIST", f"localhost:{default_ioc_port}"):
-            yield
+    with context_set_envs(
+        EPICS_CA_AUTO_ADDR_LIST="NO",
+        EPICS_CA_ADDR_LIST=f"localhost:{default_ioc_port}",
+    ):
+        yield
 
 
 @contextlib.contextmanager
@@ -404,10 +481,12 @@ def standard_test_environment(
         Path to the IOC database definition.  Defaults to using the database
         definition provided with epics-base/softIoc.
     """
-    with run_gateway(access=access, pvlist=pvlist):
-        with run_ioc(db_file=db_file, dbd_file=dbd_file):
-            with local_channel_access():
-                yield
+    with run_concurrently(
+        run_gateway(access=access, pvlist=pvlist),
+        run_ioc(db_file=db_file, dbd_file=dbd_file),
+    ):
+        with local_channel_access():
+            yield
 
 
 def standard_test_environment_decorator(
@@ -514,10 +593,14 @@ def custom_environment(
                     "PVList:\n%s",
                     textwrap.indent(textwrap.dedent(pvlist_contents), '    ')
                 )
-                with run_gateway(*gateway_args, access=access_fp.name, pvlist=pvlist_fp.name):
-                    with run_ioc(*ioc_args, db_file=dbfile_fp.name, dbd_file=dbd_file):
-                        with local_channel_access():
-                            yield
+                with run_concurrently(
+                    run_gateway(
+                        *gateway_args, access=access_fp.name, pvlist=pvlist_fp.name
+                    ),
+                    run_ioc(*ioc_args, db_file=dbfile_fp.name, dbd_file=dbd_file),
+                ):
+                    with local_channel_access():
+                        yield
 
 
 def custom_environment_decorator(
@@ -574,6 +657,38 @@ class PyepicsCallback(Protocol):
         ...
 
 
+def wait_for(
+    condition: Callable[[], bool],
+    timeout: float = 2.0,
+    poll_period: float = 0.01,
+) -> bool:
+    """
+    Wait for ``condition()`` to become true, e.g. for monitor events.
+
+    Parameters
+    ----------
+    condition : callable
+        Called with no arguments until it returns True.
+
+    timeout : float, optional
+        Maximum time to wait, in seconds.
+
+    poll_period : float, optional
+        Time between checks, in seconds.
+
+    Returns
+    -------
+    satisfied : bool
+        Whether the condition was met before the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(poll_period)
+    return True
+
+
 def get_pv_pair(
     pvname: str, *,
     ioc_prefix: str = "ioc:",
@@ -616,11 +731,13 @@ def get_pv_pair(
     ioc_pv = epics.PV(ioc_prefix + pvname, **kwargs)
     if ioc_callback is not None:
         ioc_pv.add_callback(ioc_callback)
-    ioc_pv.wait_for_connection()
 
     gateway_pv = epics.PV(gateway_prefix + pvname, **kwargs)
     if gateway_callback is not None:
         gateway_pv.add_callback(gateway_callback)
+
+    # Both searches are in flight at this point; wait on them together.
+    ioc_pv.wait_for_connection()
     gateway_pv.wait_for_connection()
     return (ioc_pv, gateway_pv)
 
@@ -648,11 +765,29 @@ class GatewayStats:
 
     def update(self):
         """Update gateway statistics."""
-        self.vctotal = epics.ca.get(self._vctotal)
-        self.pvtotal = epics.ca.get(self._pvtotal)
-        self.connected = epics.ca.get(self._connected)
-        self.active = epics.ca.get(self._active)
-        self.inactive = epics.ca.get(self._inactive)
+        chids = {
+            "vctotal": self._vctotal,
+            "pvtotal": self._pvtotal,
+            "connected": self._connected,
+            "active": self._active,
+            "inactive": self._inactive,
+        }
+        # Issue all requests before waiting on any of them, so that the
+        # round trips to the gateway overlap.
+        for chid in chids.values():
+            epics.ca.get(chid, wait=False)
+        for attr, chid in chids.items():
+            setattr(self, attr, epics.ca.get_complete(chid))
+
+    def as_dict(self) -> dict[str, Optional[int]]:
+        """The most recently retrieved statistics, keyed by name."""
+        return {
+            "vctotal": self.vctotal,
+            "pvtotal": self.pvtotal,
+            "connected": self.connected,
+            "active": self.active,
+            "inactive": self.inactive,
+        }
 
 
 def get_prop_support():
@@ -670,22 +805,46 @@ def get_prop_support():
 
         pvhigh = epics.PV("ioc:passive0.HIGH", auto_monitor=None)
         pvhigh.put(18.0, wait=True)
-        time.sleep(0.05)
+        # The property change event may take a moment on a loaded machine
+        wait_for(lambda: events_received_ioc >= 2, timeout=1.0)
 
     return events_received_ioc == 2
 
 
-@pytest.fixture(scope="module")
-def prop_supported() -> bool:
-    """Is DBE_PROPERTY supported?"""
+@pytest.fixture(scope="session")
+def prop_supported(request) -> bool:
+    """
+    Is DBE_PROPERTY supported?
+
+    Finding out means starting up an IOC and a gateway, and with ``--forked``
+    every test runs in its own process.  Only a positive answer is kept in
+    the pytest cache, for the IOC executable in use: a negative one may be
+    due to a slow probe, so it is checked again in the next session.  Without
+    the cache provider (e.g. ``-p no:cacheprovider``), it is checked once per
+    session.
+    """
+    cache = getattr(request.config, "cache", None)
+    ioc_key = f"{ioc_executable}:{os.path.getmtime(ioc_executable)}"
+    if cache is not None:
+        cached = cache.get(PROP_SUPPORT_CACHE_KEY, {})
+        if ioc_key in cached:
+            return cached[ioc_key]
+
     with ProcessPoolExecutor() as exec:
         future = exec.submit(get_prop_support)
 
-    return future.result()
+    supported = future.result()
+    if supported and cache is not None:
+        cache.set(PROP_SUPPORT_CACHE_KEY, {ioc_key: supported})
+    return supported
+
+
+# Structure keys skipped by default in comparisons
+DEFAULT_SKIP_KEYS = frozenset({"chid"})
 
 
 def find_differences(
-    struct1: dict, struct2: dict, skip_keys: Optional[list[str]] = None
+    struct1: dict, struct2: dict, skip_keys: Optional[Collection[str]] = None
 ) -> Generator[tuple[str, Any, Any], None, None]:
     """
     Compare two "structures" and yield keys and values which differ.
@@ -701,8 +860,8 @@ def find_differences(
         The second structure to compare.  Pairs with the user-friendly
         ``desc2`` description.
 
-    skip_keys : list of str, optional
-        List of keys to skip when comparing.  Defaults to ['chid'].
+    skip_keys : collection of str, optional
+        Keys to skip when comparing.  Defaults to ['chid'].
 
     Yields
     ------
@@ -716,7 +875,7 @@ def find_differences(
         The value from struct2.
     """
     if skip_keys is None:
-        skip_keys = ['chid']
+        skip_keys = DEFAULT_SKIP_KEYS
 
     for key in sorted(set(struct1).union(struct2)):
         if key not in skip_keys:
@@ -730,6 +889,9 @@ def find_differences(
             except KeyError:
                 raise RuntimeError(f"Missing key {key} in second struct")
 
+            if value1 is value2:
+                continue
+
             if hasattr(value2, "tolist"):
                 value2 = tuple(value2.tolist())
             if hasattr(value1, "tolist"):
@@ -772,33 +934,34 @@ def compare_structures(struct1, struct2, desc1="Gateway", desc2="IOC") -> str:
         User-friendly description of ``struct2``, by default referring to
         the IOC.
     """
-    differences = []
-    for key, value1, value2 in find_differences(struct1, struct2):
-        differences.append(
-            f"Element '{key}' : {desc1} has '{value1}', but "
-            f"{desc2} has '{value2}'"
-        )
-    return "\n\t".join(differences)
+    return "\n\t".join(
+        f"Element '{key}' : {desc1} has '{value1}', but "
+        f"{desc2} has '{value2}'"
+        for key, value1, value2 in find_differences(struct1, struct2)
+    )
 
 
 def find_pvinfo_differences(
     pvinfo1: PVInfo,
     pvinfo2: PVInfo,
-    skip_keys: Optional[list[str]] = None,
+    skip_keys: Optional[Collection[str]] = None,
 ) -> Generator[tuple[str, Any, Any], None, None]:
     """
     Find the differences between two PVInfo dataclasses.
     """
     if skip_keys is None:
         skip_keys = ['address']
+    skip_keys = frozenset(skip_keys)
 
-    struct1 = dataclasses.asdict(pvinfo1)
-    struct2 = dataclasses.asdict(pvinfo2)
+    # Shallow views of the fields: asdict would deep copy the value arrays
+    # and metadata dictionaries just to compare them.
+    struct1 = vars(pvinfo1)
+    struct2 = vars(pvinfo2)
 
     yield from find_differences(
         struct1=struct1,
         struct2=struct2,
-        skip_keys=skip_keys + ['time_md', 'control_md'],
+        skip_keys=skip_keys | {'time_md', 'control_md'},
     )
     if 'time_md' not in skip_keys:
         # Can be dict or None, make it dict
@@ -911,6 +1074,27 @@ def interpret_pvinfo_differences(
     return '. '.join([desc for desc in descs])
 
 
+class SubscriptionEvents(list):
+    """
+    A list of subscription events, usable directly as a pyepics callback.
+
+    This avoids wrapping a nested callback in ``functools.partial`` for each
+    subscription, so each event costs one call and one append.
+
+    Parameters
+    ----------
+    deepcopy : bool, optional
+        Store a deep copy of each event instead of the event itself.
+    """
+
+    def __init__(self, deepcopy: bool = False):
+        super().__init__()
+        self.deepcopy = deepcopy
+
+    def __call__(self, pvname=None, chid=None, **kwargs) -> None:
+        self.append(copy.deepcopy(kwargs) if self.deepcopy else kwargs)
+
+
 @contextlib.contextmanager
 def ca_subscription(
     pvname: str,
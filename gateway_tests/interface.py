@@ -6,6 +6,7 @@ import functools
 import pathlib
 import re
 import socket
+import struct
 
 IP_VARIABLE = re.compile(r"^export\s+([^= ]*)\s*=\s*(\d+\.\d+\.\d+\.\d+).*$")
 INTERFACE = re.compile(r"(.*)_IF(\d\d)")
@@ -42,6 +43,7 @@ class InterfaceInfo:
 class InterfaceConfig:
     hosts: dict[str, dict[str, InterfaceInfo]]
     subnets: dict[str, SubnetInfo]
+    _subnet_ints: list[tuple[str, int, int]]
 
     def __init__(self, epicscagp):
         self._epicscagp = pathlib.Path(epicscagp)
@@ -106,10 +108,17 @@ class InterfaceConfig:
             if not info.mask:
                 del self.subnets[name]
 
+        # (name, host bits, broadcast address) for quick subnet lookups
+        self._subnet_ints = [
+            (name, ~ip_to_int(info.mask) & 0xFFFFFFFF, ip_to_int(info.bcaddr))
+            for name, info in self.subnets.items()
+        ]
+
     @functools.lru_cache(maxsize=1000)
     def subnet_from_ip(self, ipaddr: str) -> str:
-        for name, info in self.subnets.items():
-            if info.contains_ip(ipaddr):
+        ipint = ip_to_int(ipaddr)
+        for name, hostbits, bcint in self._subnet_ints:
+            if ipint | hostbits == bcint:
                 return name
         raise ValueError(f'Recieved non-pcds ip address {ipaddr}')
 
@@ -146,8 +155,4 @@ def ip_to_str(ipaddr: int) -> str:
 
 
 def ip_to_int(ipaddr: str) -> int:
-    retval = 0
-    for octet in ipaddr.split('.'):
-        retval = retval << 8
-        retval += int(octet)
-    return retval
+    return struct.unpack('!I', socket.inet_aton(ipaddr))[0]
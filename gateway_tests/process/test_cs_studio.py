@@ -39,9 +39,14 @@ def test_cs_studio_value_and_prop_monitor():
         logger.info("New GW Value for %s value=%s, kw=%s\n", pvname, str(kws["value"]), repr(kws))
 
     # gwcachetest is an ai record with full set of alarm limits: -100 -10 10 100
+    # Create all channels up front so that their searches go out together
     gw = ca.create_channel("gateway:gwcachetest")
-    connected = ca.connect_channel(gw, timeout=0.5)
-    assert connected, "Could not connect to gateway channel " + ca.name(gw)
+    ioc = ca.create_channel("ioc:gwcachetest")
+    ioc_hihi = ca.create_channel("ioc:gwcachetest.HIHI")
+    for chid in (gw, ioc, ioc_hihi):
+        connected = ca.connect_channel(chid, timeout=0.5)
+        assert connected, "Could not connect to channel " + ca.name(chid)
+
     (gw_cbref, gw_uaref, gw_eventid) = ca.create_subscription(
         gw,
         mask=dbr.DBE_VALUE | dbr.DBE_ALARM,
@@ -51,9 +56,6 @@ def test_cs_studio_value_and_prop_monitor():
     (gw_cbref2, gw_uaref2, gw_eventid2) = ca.create_subscription(
         gw, mask=dbr.DBE_PROPERTY, use_ctrl=True, callback=on_change_gw
     )
-    ioc = ca.create_channel("ioc:gwcachetest")
-    connected = ca.connect_channel(ioc, timeout=0.5)
-    assert connected, "Could not connect to ioc channel " + ca.name(ioc)
     (ioc_cbref, ioc_uaref, ioc_eventid) = ca.create_subscription(
         ioc,
         mask=dbr.DBE_VALUE | dbr.DBE_ALARM,
@@ -67,8 +69,7 @@ def test_cs_studio_value_and_prop_monitor():
     time.sleep(0.1)
 
     # set value on IOC
-    ioc_value = ca.create_channel("ioc:gwcachetest")
-    ca.put(ioc_value, 10.0, wait=True)
+    ca.put(ioc, 10.0, wait=True)
     time.sleep(0.1)
 
     assert (
@@ -87,11 +88,10 @@ def test_cs_studio_value_and_prop_monitor():
     )
 
     # set property on IOC
-    ioc_hihi = ca.create_channel("ioc:gwcachetest.HIHI")
     ca.put(ioc_hihi, 123.0, wait=True)
     time.sleep(0.1)
 
-    ca.put(ioc_value, 11.0, wait=True)
+    ca.put(ioc, 11.0, wait=True)
     time.sleep(0.1)
 
     assert (
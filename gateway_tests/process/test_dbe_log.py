@@ -1,6 +1,5 @@
 #!/usr/bin/env python
 import logging
-import time
 
 import epics
 
@@ -43,11 +42,15 @@ def test_log_deadband():
     )
     ioc.get()
     gw.get()
-    for val in range(35):
-        ioc.put(val, wait=True)
-    time.sleep(0.1)
-
-    # We get 5 events: at connection, first put, then at 11 22 33
+    # Puts on one circuit are processed in order, so only waiting on the
+    # last one is enough to know that all of them have been processed.
+    for val in range(34):
+        ioc.put(val)
+    ioc.put(34, wait=True)
+
+    # We get 5 events: at connection, first put, then at 11 22 33.  The burst
+    # of puts may take a while to come through a loaded gateway.
+    conftest.wait_for(lambda: events_received >= 5)
     assert events_received == 5, f"events expected: 5; events received: {events_received}"
 
     # Any updates inside deadband are an error
@@ -29,36 +29,31 @@ def test_enum_prop_cache_value_monitor_ctrl_get(prop_supported):
 
     gateway_stats = conftest.GatewayStats()
     # gateway should show no VC (client side connection) and no PV (IOC side connection)
-    assert gateway_stats.vctotal == 0
-    assert gateway_stats.pvtotal == 0
-    assert gateway_stats.connected == 0
-    assert gateway_stats.active == 0
-    assert gateway_stats.inactive == 0
+    assert gateway_stats.as_dict() == dict(
+        vctotal=0, pvtotal=0, connected=0, active=0, inactive=0
+    )
 
     def on_change(pvname=None, **kws):
         ...
 
     # enumtest is an mbbi record with three strings defined: zero one two
     gw = ca.create_channel("gateway:enumtest")
-    connected = ca.connect_channel(gw, timeout=0.5)
-    assert connected, "Could not connect to gateway channel " + ca.name(gw)
+    ioc = ca.create_channel("ioc:enumtest")
+    for chid in (gw, ioc):
+        connected = ca.connect_channel(chid, timeout=0.5)
+        assert connected, "Could not connect to channel " + ca.name(chid)
     (gw_cbref, gw_uaref, gw_eventid) = ca.create_subscription(
         gw, mask=dbr.DBE_VALUE, callback=on_change
     )
-    ioc = ca.create_channel("ioc:enumtest")
-    connected = ca.connect_channel(ioc, timeout=0.5)
-    assert connected, "Could not connect to ioc channel " + ca.name(gw)
     (ioc_cbref, ioc_uaref, ioc_eventid) = ca.create_subscription(
         ioc, mask=dbr.DBE_VALUE, callback=on_change
     )
 
     # gateway should show one VC and one connected active PV
     gateway_stats.update()
-    assert gateway_stats.vctotal == 1
-    assert gateway_stats.pvtotal == 1
-    assert gateway_stats.connected == 1
-    assert gateway_stats.active == 1
-    assert gateway_stats.inactive == 0
+    assert gateway_stats.as_dict() == dict(
+        vctotal=1, pvtotal=1, connected=1, active=1, inactive=0
+    )
 
     # enum string should not have been updated
     ioc_ctrl = ca.get_ctrlvars(ioc)
@@ -97,27 +92,22 @@ def test_enum_prop_cache_value_get_ctrl_get(prop_supported):
     """
     # gateway should show no VC (client side connection) and no PV (IOC side connection)
     gateway_stats = conftest.GatewayStats()
-    assert gateway_stats.vctotal == 0
-    assert gateway_stats.pvtotal == 0
-    assert gateway_stats.connected == 0
-    assert gateway_stats.active == 0
-    assert gateway_stats.inactive == 0
+    assert gateway_stats.as_dict() == dict(
+        vctotal=0, pvtotal=0, connected=0, active=0, inactive=0
+    )
 
     # enumtest is an mbbi record with three strings defined: zero one two
     gw = ca.create_channel("gateway:enumtest")
-    connected = ca.connect_channel(gw, timeout=0.5)
-    assert connected, "Could not connect to gateway channel " + ca.name(gw)
     ioc = ca.create_channel("ioc:enumtest")
-    connected = ca.connect_channel(ioc, timeout=0.5)
-    assert connected, "Could not connect to ioc channel " + ca.name(gw)
+    for chid in (gw, ioc):
+        connected = ca.connect_channel(chid, timeout=0.5)
+        assert connected, "Could not connect to channel " + ca.name(chid)
 
     # gateway should show one VC and one connected active PV
     gateway_stats.update()
-    assert gateway_stats.vctotal == 1
-    assert gateway_stats.pvtotal == 1
-    assert gateway_stats.connected == 1
-    assert gateway_stats.active == 1
-    assert gateway_stats.inactive == 0
+    assert gateway_stats.as_dict() == dict(
+        vctotal=1, pvtotal=1, connected=1, active=1, inactive=0
+    )
 
     # enum string should not have been updated
     ioc_ctrl = ca.get_ctrlvars(ioc)
@@ -155,27 +145,22 @@ def test_enum_prop_cache_value_get_disconnect_ctrl_get():
     """
     gateway_stats = conftest.GatewayStats()
     # gateway should show no VC (client side connection) and no PV (IOC side connection)
-    assert gateway_stats.vctotal == 0
-    assert gateway_stats.pvtotal == 0
-    assert gateway_stats.connected == 0
-    assert gateway_stats.active == 0
-    assert gateway_stats.inactive == 0
+    assert gateway_stats.as_dict() == dict(
+        vctotal=0, pvtotal=0, connected=0, active=0, inactive=0
+    )
 
     # enumtest is an mbbi record with three strings defined: zero one two
     gw = ca.create_channel("gateway:enumtest")
-    connected = ca.connect_channel(gw, timeout=0.5)
-    assert connected, "Could not connect to gateway channel " + ca.name(gw)
     ioc = ca.create_channel("ioc:enumtest")
-    connected = ca.connect_channel(ioc, timeout=0.5)
-    assert connected, "Could not connect to ioc channel " + ca.name(gw)
+    for chid in (gw, ioc):
+        connected = ca.connect_channel(chid, timeout=0.5)
+        assert connected, "Could not connect to channel " + ca.name(chid)
 
     # gateway should show one VC and one connected active PV
     gateway_stats.update()
-    assert gateway_stats.vctotal == 1
-    assert gateway_stats.pvtotal == 1
-    assert gateway_stats.connected == 1
-    assert gateway_stats.active == 1
-    assert gateway_stats.inactive == 0
+    assert gateway_stats.as_dict() == dict(
+        vctotal=1, pvtotal=1, connected=1, active=1, inactive=0
+    )
 
     # enum string should not have been updated
     ioc_ctrl = ca.get_ctrlvars(ioc)
@@ -191,11 +176,9 @@ def test_enum_prop_cache_value_get_disconnect_ctrl_get():
 
     # gateway should show no VC and 1 connected inactive PV
     gateway_stats = conftest.GatewayStats()
-    assert gateway_stats.vctotal == 0
-    assert gateway_stats.pvtotal == 1
-    assert gateway_stats.connected == 1
-    assert gateway_stats.active == 0
-    assert gateway_stats.inactive == 1
+    assert gateway_stats.as_dict() == dict(
+        vctotal=0, pvtotal=1, connected=1, active=0, inactive=1
+    )
 
     # set enum string on IOC
     ioc_enum1 = ca.create_channel("ioc:enumtest.ONST")
@@ -204,19 +187,16 @@ def test_enum_prop_cache_value_get_disconnect_ctrl_get():
 
     # reconnect Gateway and IOC
     gw = ca.create_channel("gateway:enumtest")
-    connected = ca.connect_channel(gw, timeout=0.5)
-    assert connected, "Could not connect to gateway channel " + ca.name(gw)
     ioc = ca.create_channel("ioc:enumtest")
-    connected = ca.connect_channel(ioc, timeout=0.5)
-    assert connected, "Could not connect to ioc channel " + ca.name(gw)
+    for chid in (gw, ioc):
+        connected = ca.connect_channel(chid, timeout=0.5)
+        assert connected, "Could not connect to channel " + ca.name(chid)
 
     # gateway should show one VC and one connected active PV
     gateway_stats.update()
-    assert gateway_stats.vctotal == 1
-    assert gateway_stats.pvtotal == 1
-    assert gateway_stats.connected == 1
-    assert gateway_stats.active == 1
-    assert gateway_stats.inactive == 0
+    assert gateway_stats.as_dict() == dict(
+        vctotal=1, pvtotal=1, connected=1, active=1, inactive=0
+    )
 
     # Now the enum string should have been updated
     ioc_ctrl = ca.get_ctrlvars(ioc)
@@ -19,6 +19,16 @@ def timestamp_to_string(timestamp: float) -> str:
     return time.ctime(timestamp)
 
 
+class LazyTimestamp:
+    """Log-friendly timestamp, only formatted when the record is emitted."""
+
+    def __init__(self, timestamp: float):
+        self.timestamp = timestamp
+
+    def __str__(self) -> str:
+        return timestamp_to_string(self.timestamp)
+
+
 @pytest.mark.parametrize(
     "subscription_mask",
     [
@@ -45,16 +55,16 @@ def test_undefined_timestamp_subscription(subscription_mask):
         nonlocal gateway_events_received
         gateway_events_received += 1
         logger.info(
-            f' GW update: {pvname} changed to {value} at %s',
-            timestamp_to_string(timestamp)
+            " GW update: %s changed to %s at %s",
+            pvname, value, LazyTimestamp(timestamp)
         )
 
     def on_change_ioc(pvname=None, value=None, timestamp=None, **kwargs):
         nonlocal ioc_events_received
         ioc_events_received += 1
         logger.info(
-            f'IOC update: {pvname} changed to {value} at %s',
-            timestamp_to_string(timestamp)
+            "IOC update: %s changed to %s at %s",
+            pvname, value, LazyTimestamp(timestamp)
         )
 
     with conftest.ca_subscription_pair(
@@ -85,11 +95,11 @@ def test_undefined_timestamp_get_only():
         ioc_md, gateway_md = conftest.pyepics_caget_pair("HUGO:ENUM", form="time")
         logger.info(
             "IOC timestamp: %s (%s)",
-            ioc_md["timestamp"], timestamp_to_string(ioc_md["timestamp"])
+            ioc_md["timestamp"], LazyTimestamp(ioc_md["timestamp"])
         )
         logger.info(
             "Gateway timestamp: %s (%s)",
-            gateway_md["timestamp"], timestamp_to_string(gateway_md["timestamp"])
+            gateway_md["timestamp"], LazyTimestamp(gateway_md["timestamp"])
         )
 
         assert ioc_md["timestamp"] != UNDEFINED_TIMESTAMP, "IOC timestamp undefined"
@@ -15,44 +15,40 @@ from .. import conftest
 logger = logging.getLogger(__name__)
 
 
-@conftest.standard_test_environment_decorator
-def test_prop_cache_value_monitor_ctrl_get(prop_supported):
+def check_prop_cache_value_ctrl_get(prop_supported: bool, subscribe: bool):
     """
-    Monitor PV (value events) through GW - change properties (HIGH, EGU)
-    directly - get the DBR_CTRL of the PV through GW
+    Connect to the PV through GW, optionally monitoring it (value events) -
+    change properties (HIGH, EGU) directly - get the DBR_CTRL of the PV
+    through GW
     """
     def on_change(pvname=None, **kws):
         ...
 
+    # Keep references to the subscriptions so the callbacks stay alive
+    subscriptions = []
+
     # gateway should show no VC (client side connection) and no PV (IOC side connection)
     gateway_stats = conftest.GatewayStats()
-    assert gateway_stats.vctotal == 0
-    assert gateway_stats.pvtotal == 0
-    assert gateway_stats.connected == 0
-    assert gateway_stats.active == 0
-    assert gateway_stats.inactive == 0
+    assert gateway_stats.as_dict() == dict(
+        vctotal=0, pvtotal=0, connected=0, active=0, inactive=0
+    )
 
     # gwcachetest is an ai record with full set of alarm limits: -100 -10 10 100
     gw = ca.create_channel("gateway:gwcachetest")
-    connected = ca.connect_channel(gw, timeout=0.5)
-    assert connected, "Could not connect to gateway channel " + ca.name(gw)
-    (gw_cbref, gw_uaref, gw_eventid) = ca.create_subscription(
-        gw, mask=dbr.DBE_VALUE, callback=on_change
-    )
     ioc = ca.create_channel("ioc:gwcachetest")
-    connected = ca.connect_channel(ioc, timeout=0.5)
-    assert connected, "Could not connect to ioc channel " + ca.name(ioc)
-    (ioc_cbref, ioc_uaref, ioc_eventid) = ca.create_subscription(
-        ioc, mask=dbr.DBE_VALUE, callback=on_change
-    )
+    for chid in (gw, ioc):
+        connected = ca.connect_channel(chid, timeout=0.5)
+        assert connected, "Could not connect to channel " + ca.name(chid)
+        if subscribe:
+            subscriptions.append(
+                ca.create_subscription(chid, mask=dbr.DBE_VALUE, callback=on_change)
+            )
 
     # gateway should show one VC and one connected active PV
     gateway_stats.update()
-    assert gateway_stats.vctotal == 1
-    assert gateway_stats.pvtotal == 1
-    assert gateway_stats.connected == 1
-    assert gateway_stats.active == 1
-    assert gateway_stats.inactive == 0
+    assert gateway_stats.as_dict() == dict(
+        vctotal=1, pvtotal=1, connected=1, active=1, inactive=0
+    )
 
     # limit should not have been updated
     ioc_ctrl = ca.get_ctrlvars(ioc)
@@ -110,90 +106,22 @@ def test_prop_cache_value_monitor_ctrl_get(prop_supported):
     ), f"Expected GW units string: {gw_expected}; actual units string: {egu_val}"
 
 
+@conftest.standard_test_environment_decorator
+def test_prop_cache_value_monitor_ctrl_get(prop_supported):
+    """
+    Monitor PV (value events) through GW - change properties (HIGH, EGU)
+    directly - get the DBR_CTRL of the PV through GW
+    """
+    check_prop_cache_value_ctrl_get(prop_supported, subscribe=True)
+
+
 @conftest.standard_test_environment_decorator
 def test_prop_cache_value_get_ctrl_get(prop_supported):
     """
     Get PV (value) through GW - change properties (HIGH, EGU) directly -
     get the DBR_CTRL of the PV through GW
     """
-    # gateway should show no VC (client side connection) and no PV (IOC side connection)
-    gateway_stats = conftest.GatewayStats()
-    assert gateway_stats.vctotal == 0
-    assert gateway_stats.pvtotal == 0
-    assert gateway_stats.connected == 0
-    assert gateway_stats.active == 0
-    assert gateway_stats.inactive == 0
-
-    # gwcachetest is an ai record with full set of alarm limits: -100 -10 10 100
-    gw = ca.create_channel("gateway:gwcachetest")
-    connected = ca.connect_channel(gw, timeout=0.5)
-    assert connected, "Could not connect to gateway channel " + ca.name(gw)
-    ioc = ca.create_channel("ioc:gwcachetest")
-    connected = ca.connect_channel(ioc, timeout=0.5)
-    assert connected, "Could not connect to ioc channel " + ca.name(gw)
-
-    # gateway should show one VC and one connected active PV
-    gateway_stats.update()
-    assert gateway_stats.vctotal == 1
-    assert gateway_stats.pvtotal == 1
-    assert gateway_stats.connected == 1
-    assert gateway_stats.active == 1
-    assert gateway_stats.inactive == 0
-
-    # limit should not have been updated
-    ioc_ctrl = ca.get_ctrlvars(ioc)
-    high_val = ioc_ctrl["upper_warning_limit"]
-    assert high_val == 10.0, "Expected IOC warning_limit: 10; actual limit: " + str(
-        high_val
-    )
-    gw_ctrl = ca.get_ctrlvars(gw)
-    high_val = gw_ctrl["upper_warning_limit"]
-    assert high_val == 10.0, "Expected GW warning_limit: 10; actual limit: " + str(
-        high_val
-    )
-
-    # set warning limit on IOC
-    ioc_high = ca.create_channel("ioc:gwcachetest.HIGH")
-    ca.put(ioc_high, 20.0, wait=True)
-    time.sleep(0.1)
-
-    # Now the limit should have been updated (if IOC supports DBE_PROPERTY)
-    ioc_ctrl = ca.get_ctrlvars(ioc)
-    high_val = ioc_ctrl["upper_warning_limit"]
-    assert high_val == 20.0, "Expected IOC warning_limit: 20; actual limit: " + str(
-        high_val
-    )
-    if prop_supported:
-        gw_expected = 20.0
-    else:
-        gw_expected = 10.0
-    gw_ctrl = ca.get_ctrlvars(gw)
-    high_val = gw_ctrl["upper_warning_limit"]
-    assert (
-        high_val == gw_expected
-    ), f"Expected GW warning_limit: {gw_expected}; actual limit: {high_val}"
-
-    # set unit string on IOC
-    ioc_egu = ca.create_channel("ioc:gwcachetest.EGU")
-    old_egu = ca.get(ioc_egu)
-    ca.put(ioc_egu, "foo", wait=True)
-    time.sleep(0.1)
-
-    # Now the unit string should have been updated (if IOC supports DBE_PROPERTY)
-    ioc_ctrl = ca.get_ctrlvars(ioc)
-    egu_val = ioc_ctrl["units"]
-    assert egu_val == "foo", (
-        "Expected IOC units string: foo; actual units string: " + egu_val
-    )
-    if prop_supported:
-        gw_expected = "foo"
-    else:
-        gw_expected = old_egu
-    gw_ctrl = ca.get_ctrlvars(gw)
-    egu_val = gw_ctrl["units"]
-    assert (
-        egu_val == gw_expected
-    ), f"Expected GW units string: {gw_expected}; actual units string: {egu_val}"
+    check_prop_cache_value_ctrl_get(prop_supported, subscribe=False)
 
 
 @conftest.standard_test_environment_decorator
@@ -204,27 +132,22 @@ def test_prop_cache_value_get_disconnect_ctrl_get():
     """
     # gateway should show no VC (client side connection) and no PV (IOC side connection)
     gateway_stats = conftest.GatewayStats()
-    assert gateway_stats.vctotal == 0
-    assert gateway_stats.pvtotal == 0
-    assert gateway_stats.connected == 0
-    assert gateway_stats.active == 0
-    assert gateway_stats.inactive == 0
+    assert gateway_stats.as_dict() == dict(
+        vctotal=0, pvtotal=0, connected=0, active=0, inactive=0
+    )
 
     # gwcachetest is an ai record with full set of alarm limits: -100 -10 10 100
     gw = ca.create_channel("gateway:gwcachetest")
-    connected = ca.connect_channel(gw, timeout=0.5)
-    assert connected, "Could not connect to gateway channel " + ca.name(gw)
     ioc = ca.create_channel("ioc:gwcachetest")
-    connected = ca.connect_channel(ioc, timeout=0.5)
-    assert connected, "Could not connect to ioc channel " + ca.name(gw)
+    for chid in (gw, ioc):
+        connected = ca.connect_channel(chid, timeout=0.5)
+        assert connected, "Could not connect to channel " + ca.name(chid)
 
     # gateway should show one VC and one connected active PV
     gateway_stats.update()
-    assert gateway_stats.vctotal == 1
-    assert gateway_stats.pvtotal == 1
-    assert gateway_stats.connected == 1
-    assert gateway_stats.active == 1
-    assert gateway_stats.inactive == 0
+    assert gateway_stats.as_dict() == dict(
+        vctotal=1, pvtotal=1, connected=1, active=1, inactive=0
+    )
 
     # limit should not have been updated
     ioc_ctrl = ca.get_ctrlvars(ioc)
@@ -252,11 +175,9 @@ def test_prop_cache_value_get_disconnect_ctrl_get():
 
     # gateway should show no VC and 1 connected inactive PV
     gateway_stats = conftest.GatewayStats()
-    assert gateway_stats.vctotal == 0
-    assert gateway_stats.pvtotal == 1
-    assert gateway_stats.connected == 1
-    assert gateway_stats.active == 0
-    assert gateway_stats.inactive == 1
+    assert gateway_stats.as_dict() == dict(
+        vctotal=0, pvtotal=1, connected=1, active=0, inactive=1
+    )
 
     # set warning limit on IOC
     ioc_high = ca.create_channel("ioc:gwcachetest.HIGH")
@@ -268,19 +189,16 @@ def test_prop_cache_value_get_disconnect_ctrl_get():
 
     # reconnect Gateway and IOC
     gw = ca.create_channel("gateway:gwcachetest")
-    connected = ca.connect_channel(gw, timeout=0.5)
-    assert connected, "Could not connect to gateway channel " + ca.name(gw)
     ioc = ca.create_channel("ioc:gwcachetest")
-    connected = ca.connect_channel(ioc, timeout=0.5)
-    assert connected, "Could not connect to ioc channel " + ca.name(gw)
+    for chid in (gw, ioc):
+        connected = ca.connect_channel(chid, timeout=0.5)
+        assert connected, "Could not connect to channel " + ca.name(chid)
 
     # gateway should show one VC and one connected active PV
     gateway_stats.update()
-    assert gateway_stats.vctotal == 1
-    assert gateway_stats.pvtotal == 1
-    assert gateway_stats.connected == 1
-    assert gateway_stats.active == 1
-    assert gateway_stats.inactive == 0
+    assert gateway_stats.as_dict() == dict(
+        vctotal=1, pvtotal=1, connected=1, active=1, inactive=0
+    )
 
     # now the limit should have been updated
     ioc_ctrl = ca.get_ctrlvars(ioc)
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 import logging
 import os
-import time
+import threading
 
 import pytest
 from epics import ca, dbr
@@ -30,12 +30,24 @@ def test_ctrl_struct_value_monitor():
     events_received_gw = 0
     ioc_struct = {}
     gw_struct = {}
+    updated = threading.Condition()
+
+    def wait_for_value(value, timeout=2.0):
+        """Wait for both the IOC and the gateway to report ``value``."""
+        with updated:
+            updated.wait_for(
+                lambda: ioc_struct.get("value") == value
+                and gw_struct.get("value") == value,
+                timeout=timeout,
+            )
 
     def on_change_ioc(pvname=None, **kws):
         nonlocal events_received_ioc
         nonlocal ioc_struct
-        events_received_ioc += 1
-        ioc_struct = kws
+        with updated:
+            events_received_ioc += 1
+            ioc_struct = kws
+            updated.notify_all()
         logger.info(
             "New IOC Value for %s value=%s, kw=%s\n",
             pvname,
@@ -46,8 +58,10 @@ def test_ctrl_struct_value_monitor():
     def on_change_gw(pvname=None, **kws):
         nonlocal gw_struct
         nonlocal events_received_gw
-        events_received_gw += 1
-        gw_struct = kws
+        with updated:
+            events_received_gw += 1
+            gw_struct = kws
+            updated.notify_all()
         logger.info(
             "New GW Value for %s value=%s, kw=%s\n",
             pvname,
@@ -73,7 +87,7 @@ def test_ctrl_struct_value_monitor():
     # set value on IOC
     ioc_value = ca.create_channel("ioc:gwcachetest")
     ca.put(ioc_value, 10.0, wait=True)
-    time.sleep(0.1)
+    wait_for_value(10.0)
 
     assert events_received_ioc == events_received_gw, (
         f"After setting value, no. of received updates differ: "
@@ -90,7 +104,7 @@ def test_ctrl_struct_value_monitor():
     ioc_hihi = ca.create_channel("ioc:gwcachetest.HIHI")
     ca.put(ioc_hihi, 123.0, wait=True)
     ca.put(ioc_value, 11.0, wait=True)  # trigger update
-    time.sleep(0.1)
+    wait_for_value(11.0)
 
     assert events_received_ioc == events_received_gw, (
         f"After setting property, no. of received updates differ: "
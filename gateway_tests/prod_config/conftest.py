@@ -1,23 +1,32 @@
 """
 Test fixtures and utilities specific to prod testing
 """
+import functools
 import logging
+import os
 import socket
 import subprocess
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Sequence
 
 import pytest
 
 from ..config import PCDSConfiguration
 from ..conftest import (find_pvinfo_differences, interpret_pvinfo_differences,
                         prod_gw_addrs, prod_ioc_addrs, pvinfo_diff_report)
-from ..util import (caget_from_host, correct_gateway_pvinfo,
+from ..util import (PVInfo, caget_from_host, correct_gateway_pvinfo,
                     predict_gateway_response)
 
 HUTCHES = ['tmo', 'rix', 'xpp', 'xcs', 'mfx', 'cxi', 'mec']
 SUFFS = ['control', 'daq']
 CLIENT_HOSTS = [f'{hutch}-{suff}' for hutch in HUTCHES for suff in SUFFS]
+PING_TIMEOUT = 1
+MAX_PING_WORKERS = 32
+USE_CACHED_OFFLINE_ENV_VAR = 'PYTEST_GATEWAY_USE_CACHED_OFFLINE'
+OFFLINE_HOSTS_CACHE_KEY = 'pcds/offline_hosts'
+DISCONNECTED_IOCS_CACHE_KEY = 'pcds/disconnected_iocs'
 
 logger = logging.getLogger(__name__)
 config = PCDSConfiguration.instance()
@@ -25,6 +34,25 @@ our_host = socket.gethostname()
 disconnected_iocs = set()
 online_hosts = set()
 offline_hosts = set()
+use_cached_offline = os.environ.get(
+    USE_CACHED_OFFLINE_ENV_VAR, ''
+).lower().startswith('y')
+# Set by the offline_cache fixture when use_cached_offline is enabled
+offline_cache_store = None
+
+
+def _get_client_host_subnets() -> dict[str, str]:
+    """Subnet of each of CLIENT_HOSTS, which do not change during a test run."""
+    subnets = {}
+    for host in CLIENT_HOSTS:
+        try:
+            subnets[host] = config.interface_config.subnet_from_hostname(host)
+        except (OSError, ValueError):
+            logger.error(f'Skip client host {host}, issue resolving subnet.')
+    return subnets
+
+
+CLIENT_HOST_SUBNETS = _get_client_host_subnets()
 
 
 def maybe_skip_host(hostname):
@@ -42,24 +70,128 @@ def maybe_skip_host(hostname):
         online_hosts.add(hostname)
 
 
-def ping(hostname):
-    return subprocess.call(['ping', '-c', '1', str(hostname)]) == 0
+def ping(hostname, timeout=PING_TIMEOUT):
+    return subprocess.call(
+        ['ping', '-c', '1', '-W', str(timeout), str(hostname)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    ) == 0
+
+
+def ping_many(hostnames, timeout=PING_TIMEOUT):
+    """Ping all of hostnames concurrently, returning {hostname: online}."""
+    hostnames = list(hostnames)
+    if not hostnames:
+        return {}
+    workers = min(len(hostnames), MAX_PING_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            functools.partial(ping, timeout=timeout), hostnames
+        )
+        return dict(zip(hostnames, results))
+
+
+@pytest.fixture(scope='session', autouse=True)
+def offline_cache(request):
+    """
+    Share offline hosts and disconnected IOCs through the pytest cache.
+
+    Only active if PYTEST_GATEWAY_USE_CACHED_OFFLINE=y. This lets xdist
+    workers and later runs skip hosts and IOCs that some other worker or
+    run already found to be unreachable, instead of each one waiting on
+    its own timeouts. Use ``--cache-clear`` to start over.
+    """
+    global offline_cache_store
+    if not use_cached_offline:
+        yield
+        return
+    offline_cache_store = request.config.cache
+    offline_hosts.update(
+        offline_cache_store.get(OFFLINE_HOSTS_CACHE_KEY, [])
+    )
+    yield
+    # Other workers may have written to the cache since we read it
+    offline_cache_store.set(
+        OFFLINE_HOSTS_CACHE_KEY,
+        sorted(
+            offline_hosts.union(
+                offline_cache_store.get(OFFLINE_HOSTS_CACHE_KEY, [])
+            )
+        ),
+    )
+
+
+def is_ioc_disconnected(iocname):
+    """Check if iocname was found disconnected in this run or a cached one."""
+    if iocname in disconnected_iocs:
+        return True
+    if offline_cache_store is None or iocname is None:
+        return False
+    if offline_cache_store.get(
+        f'{DISCONNECTED_IOCS_CACHE_KEY}/{iocname}', False
+    ):
+        disconnected_iocs.add(iocname)
+        return True
+    return False
+
+
+def mark_ioc_disconnected(iocname):
+    """Remember that iocname is disconnected, sharing it if caching."""
+    disconnected_iocs.add(iocname)
+    if offline_cache_store is not None:
+        # One key per IOC so that concurrent workers never overwrite
+        # each other's results.
+        offline_cache_store.set(
+            f'{DISCONNECTED_IOCS_CACHE_KEY}/{iocname}', True
+        )
+
+
+@pytest.fixture(scope='session')
+def ioc_host_sweep(request, offline_cache):
+    """
+    Sort the IOC hosts of the selected tests into online and offline hosts.
+
+    Only the hosts serving the ``pvname`` parameters of the tests left
+    after collection and deselection (e.g. ``-k``) are pinged, concurrently
+    and up front, so that maybe_skip_host does not ping each of them
+    serially as it is first encountered.
+    """
+    hostnames = set()
+    for item in request.session.items:
+        callspec = getattr(item, 'callspec', None)
+        if callspec is not None and callspec.params.get('pvname'):
+            hostnames.add(get_ioc_host(callspec.params['pvname']))
+    hostnames -= online_hosts | offline_hosts | {None}
+    for hostname, online in ping_many(sorted(hostnames)).items():
+        if online:
+            online_hosts.add(hostname)
+        else:
+            offline_hosts.add(hostname)
 
 
 class DisconnectedError(Exception):
     ...
 
 
-def compare_gets(pvname: str, hosts: list[str], skip_disconnected=False):
+def compare_gets(
+    pvname: str,
+    hosts: Sequence[str],
+    skip_disconnected=False,
+):
     """
     Check if the gateway gives us the correct value.
 
     Must be run on a gateway machine.
 
     Gets a value from the IOC, and then from the gateway as
-    various source hosts.
+    various source hosts.  The gateway requests for each source host are
+    independent, so they are made concurrently.
+
+    If any differences are found, the IOC is queried a second time and
+    fields that changed in the meantime are not compared.
     """
-    gw_pvinfo = {}
+    def get_from_host(host: str) -> tuple[str, PVInfo]:
+        return host, caget_from_host(hostname=host, pvname=pvname)
 
     with prod_ioc_addrs(config):
         true_pvinfo = caget_from_host(
@@ -69,11 +201,47 @@ def compare_gets(pvname: str, hosts: list[str], skip_disconnected=False):
     if skip_disconnected and true_pvinfo.error == 'timeout':
         raise DisconnectedError(f'{pvname} is disconnected. Aborting.')
     with prod_gw_addrs(config):
-        for host in hosts:
-            gw_pvinfo[host] = caget_from_host(
-                hostname=host,
-                pvname=pvname,
+        with ThreadPoolExecutor(max_workers=max(len(hosts), 1)) as executor:
+            gw_pvinfo = dict(executor.map(get_from_host, hosts))
+
+    all_predicts = {}
+    answers = {}
+    # The expected gateway pvinfo only depends on the predicted access,
+    # which is the same for most hosts.
+    answers_by_access = {}
+    for host in gw_pvinfo:
+        predicted_response = predict_gateway_response(
+            config=config,
+            pvname=pvname,
+            hostname=host,
+        )
+        all_predicts[host] = predicted_response
+        try:
+            answers[host] = answers_by_access[predicted_response.access]
+        except KeyError:
+            answers[host] = correct_gateway_pvinfo(
+                response_summary=predicted_response,
+                pvinfo=true_pvinfo,
+            )
+            answers_by_access[predicted_response.access] = answers[host]
+
+    def find_all_diffs(skip_keys: tuple[str, ...]) -> dict[str, list]:
+        return {
+            host: list(
+                find_pvinfo_differences(
+                    answers[host],
+                    pvinfo,
+                    skip_keys=skip_keys,
+                )
             )
+            for host, pvinfo in gw_pvinfo.items()
+        }
+
+    all_diffs = find_all_diffs(('address',))
+    if not any(all_diffs.values()):
+        return all_diffs, all_predicts, true_pvinfo
+
+    # Something differs: make sure the PV didn't just update underneath us
     with prod_ioc_addrs(config):
         post_pvinfo = caget_from_host(
             hostname=our_host,
@@ -88,46 +256,43 @@ def compare_gets(pvname: str, hosts: list[str], skip_disconnected=False):
             f'{pvname} updated during compare_gets, '
             'ignoring fields that changed.'
         )
-
-    all_predicts = {}
-    all_diffs = {}
-    for host, pvinfo in gw_pvinfo.items():
-        predicted_response = predict_gateway_response(
-            config=config,
-            pvname=pvname,
-            hostname=host,
-        )
-        all_predicts[host] = predicted_response
-        answer = correct_gateway_pvinfo(
-            response_summary=predicted_response,
-            pvinfo=true_pvinfo,
-        )
-        all_diffs[host] = list(
-            find_pvinfo_differences(
-                answer,
-                pvinfo,
-                skip_keys=['address'] + list(sanity_diff.keys())
-            )
-        )
+        all_diffs = find_all_diffs(('address', *sanity_diff))
     return all_diffs, all_predicts, true_pvinfo
 
 
+@functools.lru_cache(maxsize=None)
 def get_iocname(pvname):
     base_pvname = pvname.split('.')[0]
     return config.pv_to_ioc[base_pvname]
 
 
+def get_ioc_host(pvname):
+    """The host of the IOC serving pvname, or None if it is not known."""
+    try:
+        return config.ioc_to_host[get_iocname(pvname)]
+    except KeyError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_hosts_off_subnet(subnet: str) -> tuple[str, ...]:
+    """The CLIENT_HOSTS that are not on subnet."""
+    return tuple(
+        host for host, host_subnet in CLIENT_HOST_SUBNETS.items()
+        if host_subnet != subnet
+    )
+
+
 def compare_gets_all_reasonable_hosts(pvname, skip_disconnected=False):
     # Try every host except the ones that pvname shares subnet with
     iocname = get_iocname(pvname)
     hostname = config.ioc_to_host[iocname]
     pv_subnet = config.interface_config.subnet_from_hostname(hostname)
-
-    hosts = [
-        host for host in CLIENT_HOSTS
-        if pv_subnet != config.interface_config.subnet_from_hostname(host)
-    ]
-    return compare_gets(pvname, hosts, skip_disconnected=skip_disconnected)
+    return compare_gets(
+        pvname,
+        get_hosts_off_subnet(pv_subnet),
+        skip_disconnected=skip_disconnected,
+    )
 
 
 def assert_cagets(pvname, skip_disconnected=False):
@@ -136,7 +301,7 @@ def assert_cagets(pvname, skip_disconnected=False):
             iocname = get_iocname(pvname)
         except KeyError:
             iocname = None
-        if iocname in disconnected_iocs:
+        if is_ioc_disconnected(iocname):
             pytest.skip(f'IOC {iocname} is disconnected.')
         try:
             hostname = config.ioc_to_host[iocname]
@@ -151,19 +316,26 @@ def assert_cagets(pvname, skip_disconnected=False):
     except DisconnectedError:
         if skip_disconnected:
             if iocname is not None:
-                disconnected_iocs.add(iocname)
+                mark_ioc_disconnected(iocname)
             pytest.skip(f'PV {pvname} is disconnected.')
     for host, diff in diffs.items():
         assert not diff, interpret_pvinfo_differences(diff, pvname)
     return diffs, predicts, true_pvinfo
 
 
-def get_extra_pvs(pvlist):
-    extra_pvs = []
+def with_extra_pvs(pvlist):
+    """
+    Add the extra fields worth checking for some of the PVs in pvlist.
+
+    Each extra PV directly follows its base PV, so that they run back to
+    back and share the cached IOC lookups and disconnected/offline status.
+    """
+    full_pvlist = []
     for pvname in pvlist:
+        full_pvlist.append(pvname)
         if pvname.endswith(':ArrayData'):
-            extra_pvs.append(f'{pvname}.NORD')
-    return extra_pvs
+            full_pvlist.append(f'{pvname}.NORD')
+    return full_pvlist
 
 
 @pytest.fixture(scope='module')
@@ -11,22 +11,24 @@ MAX_PV_CHECKS_PER_DEVICE = 100
 logger = logging.getLogger(__name__)
 config = PCDSConfiguration.instance()
 pvlists_by_happi_name = config.happi_info.get_pvlist_by_key()
-missing_pvs = set(get_missing_pvs())
-
-
-@pytest.mark.parametrize("name", list(pvlists_by_happi_name))
-def test_happi_devices(name):
-    pvlist = pvlists_by_happi_name[name]
-    pvs_checked = 0
-    for pvname in pvlist:
-        if pvname in missing_pvs:
-            logger.warning(f'Skip {pvname}, missing from pvlists.')
-            continue
-        _, _, pvinfo = assert_cagets(pvname)
-        pvs_checked += 1
-        if pvinfo.error == 'timeout':
-            logger.warning(f'Skip rest of {name}, disconnected PV')
-            break
-        if pvs_checked >= MAX_PV_CHECKS_PER_DEVICE:
-            break
-    assert pvs_checked > 0, f'Ran test for {name} without checking any PVs'
+missing_pvs = frozenset(get_missing_pvs())
+
+
+def get_happi_device_params():
+    """One param per (device, pvname) pair, so devices can be split up."""
+    params = []
+    for name, pvlist in pvlists_by_happi_name.items():
+        pvnames = [
+            pvname for pvname in pvlist if pvname not in missing_pvs
+        ][:MAX_PV_CHECKS_PER_DEVICE]
+        # Keep devices with nothing to check visible as failures
+        for pvname in pvnames or [None]:
+            params.append(pytest.param(name, pvname, id=f'{name}::{pvname}'))
+    return params
+
+
+@pytest.mark.parametrize("name, pvname", get_happi_device_params())
+def test_happi_devices(name, pvname, ioc_host_sweep):
+    assert pvname is not None, f'Ran test for {name} without checking any PVs'
+    # Once one PV from an IOC times out, the rest of that IOC's PVs skip
+    assert_cagets(pvname, skip_disconnected=True)
@@ -4,7 +4,7 @@ import os
 import pytest
 
 from ..config import PCDSConfiguration
-from .conftest import assert_cagets, get_extra_pvs
+from .conftest import assert_cagets, with_extra_pvs
 
 ENV_VAR = 'PYTEST_GATEWAY_SUBNETS'
 
@@ -25,21 +25,25 @@ if 'test_the_tests' in subnets:
         'IM1K0:XTES:CAM:IMAGE1:ArrayData',
     ]
 elif subnets:
-    pvlist = []
-    for pvname, iocname in config.pv_to_ioc.items():
+    # Many PVs share an IOC, so resolve each IOC's subnet only once
+    ioc_in_subnets = {}
+    for iocname in set(config.pv_to_ioc.values()):
         try:
             hostname = config.ioc_to_host[iocname]
             subnet = config.interface_config.subnet_from_hostname(hostname)
-            if subnet in subnets:
-                pvlist.append(pvname)
         except Exception:
-            logger.error(f'Skip {pvname}, issue resolving subnet.')
+            logger.error(f'Skip PVs from {iocname}, issue resolving subnet.')
+            ioc_in_subnets[iocname] = False
+        else:
+            ioc_in_subnets[iocname] = subnet in subnets
+    pvlist = [
+        pvname for pvname, iocname in config.pv_to_ioc.items()
+        if ioc_in_subnets[iocname]
+    ]
 else:
     pvlist = list(config.pv_to_ioc.keys())
 
-extra_pvs = get_extra_pvs(pvlist)
-
 
-@pytest.mark.parametrize("pvname", pvlist + extra_pvs)
-def test_subnet_pvs(pvname, diff_report):
+@pytest.mark.parametrize("pvname", with_extra_pvs(pvlist))
+def test_subnet_pvs(pvname, diff_report, ioc_host_sweep):
     assert_cagets(pvname, skip_disconnected=True)
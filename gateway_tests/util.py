@@ -1,11 +1,14 @@
 import contextlib
 import dataclasses
 import enum
+import functools
 import getpass
 import logging
 import os.path
 import socket
-from typing import Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Collection, Optional
 
 import caproto
 import caproto.sync.client as ca_client
@@ -15,6 +18,8 @@ from .config import PCDSConfiguration
 
 logger = logging.getLogger(__name__)
 
+MAX_CAGET_WORKERS = 32
+
 
 @dataclasses.dataclass
 class PVInfo:
@@ -48,48 +53,84 @@ def bound_udp_socket(
     udp_sock.close()
 
 
-@contextlib.contextmanager
-def override_hostname_and_username(
-    hostname: Optional[str] = None,
-    username: Optional[str] = None
-):
-    """Optionally monkeypatch/override socket.gethostname and getpass.getuser."""
-    orig_gethostname = socket.gethostname
-    orig_getuser = getpass.getuser
-
-    def get_host_name() -> str:
-        host = hostname or orig_gethostname()
-        logger.debug("Hostname will be: %s", host)
-        return host
-
-    def get_user() -> str:
-        user = username or orig_getuser()
-        logger.debug("Username will be: %s", user)
-        return user
+def _make_channel(
+    pvname: str,
+    udp_sock: socket.socket,
+    priority: int,
+    timeout: float,
+    hostname: str,
+    username: str,
+) -> caproto.ClientChannel:
+    """
+    Create a sync client channel on its own circuit.
 
+    Unlike ``caproto.sync.client.make_channel``, the circuit is not shared
+    through ``global_circuits`` and the host/user names are sent explicitly
+    rather than read from ``socket.gethostname`` and ``getpass.getuser``.
+    This allows callers on different threads to each identify as a different
+    host at the same time.
+    """
+    address = ca_client.search(pvname, udp_sock, timeout)
+    circuit = caproto.VirtualCircuit(
+        our_role=caproto.CLIENT, address=address, priority=priority
+    )
+    chan = caproto.ClientChannel(pvname, circuit)
+    ca_client.sockets[circuit] = socket.create_connection(address, timeout)
     try:
-        getpass.getuser = get_user
-        socket.gethostname = get_host_name
-        yield
-    finally:
-        getpass.getuser = orig_getuser
-        socket.gethostname = orig_gethostname
+        circuit.our_address = ca_client.sockets[circuit].getsockname()
+        ca_client.send(
+            circuit,
+            caproto.VersionRequest(
+                priority=priority, version=caproto.DEFAULT_PROTOCOL_VERSION
+            ),
+            pvname,
+        )
+        ca_client.send(circuit, chan.host_name(hostname))
+        ca_client.send(circuit, chan.client_name(username))
+        ca_client.send(circuit, chan.create(), pvname)
+        t0 = time.monotonic()
+        while chan.states[caproto.CLIENT] is not caproto.CONNECTED:
+            try:
+                commands = ca_client.recv(circuit)
+            except socket.timeout:
+                commands = []
+            if time.monotonic() - t0 > timeout:
+                raise caproto.CaprotoTimeoutError(
+                    "Timeout while awaiting channel creation."
+                )
+            if any(command is caproto.DISCONNECTED for command in commands):
+                raise caproto.CaprotoError("Disconnected during initialization")
+    except BaseException:
+        ca_client.sockets.pop(circuit).close()
+        raise
+    return chan
 
 
 def _channel_cleanup(chan: caproto.ClientChannel):
-    """Clean up the sync client channel."""
+    """Clean up a channel created by ``_make_channel``."""
     try:
         if chan.states[caproto.CLIENT] is caproto.CONNECTED:
             ca_client.send(chan.circuit, chan.clear(), chan.name)
     finally:
-        ca_client.sockets[chan.circuit].close()
-        del ca_client.sockets[chan.circuit]
-        del ca_client.global_circuits[(chan.circuit.address, chan.circuit.priority)]
+        ca_client.sockets.pop(chan.circuit).close()
+
+
+@functools.lru_cache(maxsize=1)
+def _default_username() -> str:
+    """The user running the tests, which does not change during a run."""
+    return getpass.getuser()
 
 
 def _basic_enum_name(value) -> str:
-    """AccessRights.X -> X"""
-    return str(value).split(".", 1)[1]
+    """AccessRights.X -> X, using the enum name rather than parsing str()"""
+    name = value.name
+    if name is not None and "|" not in name:
+        return name
+    # Combined flags: highest first, e.g. WRITE|READ, on all Python versions
+    return "|".join(
+        member.name for member in reversed(type(value))
+        if member.value and member & value == member
+    )
 
 
 def caget_from_host(
@@ -99,11 +140,13 @@ def caget_from_host(
     priority: int = 0,
     udp_sock: Optional[socket.socket] = None,
     username: Optional[str] = None,
+    read_types: Collection[str] = ("control", "time"),
+    max_value_count: int = 1000,
 ) -> PVInfo:
     """
     Read a Channel's access security settings for the given hostname.
 
-    Not thread-safe.
+    Thread-safe, provided ``udp_sock`` is not shared between threads.
 
     Parameters
     ----------
@@ -119,6 +162,13 @@ def caget_from_host(
         Optional re-usable UDP socket.
     username : str, optional
         The username to provide when performing the caget.
+    read_types : collection of {"control", "time"}, optional
+        Which reads to perform after connecting.  Leave out "control" to
+        skip the control metadata, or "time" to skip the value and time
+        metadata.  Pass an empty collection to check only the connection
+        information, such as the access rights.
+    max_value_count : int, optional
+        The most array elements to read for the value.  Default is 1000.
 
     Returns
     -------
@@ -128,34 +178,45 @@ def caget_from_host(
     chan = None
     pv_info = PVInfo(name=pvname)
     try:
-        with bound_udp_socket(
-            udp_sock, timeout=timeout
-        ) as udp_sock, override_hostname_and_username(hostname, username):
-            chan = ca_client.make_channel(pvname, udp_sock, priority, timeout)
+        with bound_udp_socket(udp_sock, timeout=timeout) as udp_sock:
+            chan = _make_channel(
+                pvname,
+                udp_sock,
+                priority,
+                timeout,
+                hostname=hostname,
+                username=username or _default_username(),
+            )
             pv_info.access = _basic_enum_name(chan.access_rights)
             pv_info.data_type = _basic_enum_name(chan.native_data_type)
             pv_info.data_count = chan.native_data_count
             pv_info.address = chan.circuit.address
-            control_value = ca_client._read(
-                chan,
-                timeout,
-                data_type=ca_client.field_types["control"][chan.native_data_type],
-                data_count=min((chan.native_data_count, 1)),
-                force_int_enums=True,
-                notify=True,
-            )
-            pv_info.control_md = control_value.metadata.to_dict()
-
-            time_value = ca_client._read(
-                chan,
-                timeout,
-                data_type=ca_client.field_types["time"][chan.native_data_type],
-                data_count=min((chan.native_data_count, 1000)),
-                force_int_enums=True,
-                notify=True,
-            )
-            pv_info.time_md = time_value.metadata.to_dict()
-            pv_info.value = time_value.data
+            if "control" in read_types:
+                control_value = ca_client._read(
+                    chan,
+                    timeout,
+                    data_type=ca_client.field_types["control"][
+                        chan.native_data_type
+                    ],
+                    data_count=min((chan.native_data_count, 1)),
+                    force_int_enums=True,
+                    notify=True,
+                )
+                pv_info.control_md = control_value.metadata.to_dict()
+
+            if "time" in read_types:
+                time_value = ca_client._read(
+                    chan,
+                    timeout,
+                    data_type=ca_client.field_types["time"][
+                        chan.native_data_type
+                    ],
+                    data_count=min((chan.native_data_count, max_value_count)),
+                    force_int_enums=True,
+                    notify=True,
+                )
+                pv_info.time_md = time_value.metadata.to_dict()
+                pv_info.value = time_value.data
     except TimeoutError:
         pv_info.error = "timeout"
     finally:
@@ -165,8 +226,15 @@ def caget_from_host(
     return pv_info
 
 
+# Already JSON-friendly; checked by exact type to skip isinstance MRO walks
+_PLAIN_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
 def _filter_data(data):
     """Filter data for byte strings and other non-JSON serializable items."""
+    if type(data) in _PLAIN_TYPES:
+        return data
+
     if isinstance(data, dict):
         return {
             key: _filter_data(value)
@@ -174,28 +242,47 @@ def _filter_data(data):
         }
 
     if isinstance(data, np.ndarray):
+        # Numeric arrays convert in one go; only byte strings need decoding
+        if data.dtype.kind == "S":
+            return np.char.decode(data, "latin-1", "ignore").tolist()
+        if data.dtype.kind == "O":
+            return _filter_data(data.tolist())
         return data.tolist()
 
     if isinstance(data, (list, tuple)):
-        return [_filter_data(item) for item in data]
+        return [
+            item if type(item) in _PLAIN_TYPES else _filter_data(item)
+            for item in data
+        ]
 
     if isinstance(data, bytes):
-        return str(data, "latin-1", "ignore")  # _EPICS_
+        return data.decode("latin-1", "ignore")  # _EPICS_
     return data
 
 
-def caget_many_from_host(hostname, *pvnames):
-    with bound_udp_socket() as udp_sock:
-        results = {}
-        for pvname in pvnames:
-            try:
-                info = caget_from_host(hostname, pvname, udp_sock=udp_sock)
-            except TimeoutError:
-                info = PVInfo(
-                    name=pvname,
-                    error="timeout",
-                )
-            results[pvname] = _filter_data(dataclasses.asdict(info))
+def caget_many_from_host(hostname, *pvnames, **kwargs):
+    """
+    caget_from_host for each of pvnames, with the gets made concurrently.
+
+    Each worker uses its own UDP socket, so that disconnected PVs time out
+    in parallel rather than one after another.  Keyword arguments, such as
+    ``read_types``, are passed on to caget_from_host.
+    """
+    def get_one(pvname: str) -> tuple[str, dict]:
+        try:
+            info = caget_from_host(hostname, pvname, **kwargs)
+        except TimeoutError:
+            info = PVInfo(
+                name=pvname,
+                error="timeout",
+            )
+        return pvname, _filter_data(vars(info))
+
+    results = {}
+    if pvnames:
+        workers = min(len(pvnames), MAX_CAGET_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results.update(executor.map(get_one, pvnames))
 
     return {
         "hostname": hostname,
@@ -211,13 +298,16 @@ class AccessBehavior(enum.IntEnum):
     WRITE = 4
 
 
+# Both the values and the names, e.g. 3 and 'READ'
+_access_lookup = {
+    **{behavior.value: behavior for behavior in AccessBehavior},
+    **{behavior.name: behavior for behavior in AccessBehavior},
+}
+
+
 def interpret_access(access):
     try:
-        return AccessBehavior(access)
-    except ValueError:
-        pass
-    try:
-        return AccessBehavior[access]
+        return _access_lookup[access]
     except KeyError:
         pass
     if access.startswith('WRITE'):
@@ -226,21 +316,11 @@ def interpret_access(access):
 
 
 def promote_access(current, new):
-    current = interpret_access(current)
-    new = interpret_access(new)
-    if new > current:
-        return new
-    else:
-        return current
+    return max(interpret_access(current), interpret_access(new))
 
 
 def demote_access(current, new):
-    current = interpret_access(current)
-    new = interpret_access(new)
-    if new < current:
-        return new
-    else:
-        return current
+    return min(interpret_access(current), interpret_access(new))
 
 
 @dataclasses.dataclass
@@ -270,6 +350,86 @@ class GatewayResponseSummary(GatewayResponse):
     other_responses: dict[str, GatewayResponse]
 
 
+def _access_group_behavior(access_security, group_name, hostname):
+    """Evaluate the rules of one access security group for hostname."""
+    access = AccessBehavior.DISCONNECTED
+    for rule in access_security.groups[group_name].rules:
+        if rule.hosts is None or any(
+            hostname in access_security.hosts[host_group].hosts
+            for host_group in rule.hosts
+        ):
+            access = promote_access(access, rule.options)
+    return access
+
+
+@functools.lru_cache(maxsize=None)
+def get_access_group_index(
+    config: PCDSConfiguration,
+    group_name: str,
+) -> tuple[AccessBehavior, dict[str, AccessBehavior]]:
+    """
+    Pre-evaluate one access security group for every relevant host.
+
+    Groups are evaluated lazily, as they are first used, so a problem in
+    one group only affects the PVs that use it.
+
+    Returns
+    -------
+    default_access : AccessBehavior
+        The access given to hosts not named in any of the group's rules.
+    host_access : dict
+        The access given to each host that is.
+    """
+    access_security = config.access_security
+    named_hosts = set()
+    for rule in access_security.groups[group_name].rules:
+        for host_group in rule.hosts or ():
+            named_hosts.update(access_security.hosts[host_group].hosts)
+    return (
+        _access_group_behavior(access_security, group_name, None),
+        {
+            host: _access_group_behavior(access_security, group_name, host)
+            for host in named_hosts
+        },
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def gateway_procname_from_filename(filename: str) -> Optional[str]:
+    """
+    Get the gateway process name from a pvlist filename.
+
+    Returns None for leftover old pvlists, which are not in use.
+    There are only a handful of pvlist files, so this is cached.
+    """
+    gateway_procname = os.path.basename(filename).split('.')[0]
+    # Edge case: people leaving old pvlists in the config
+    if gateway_procname.endswith('old'):
+        return None
+    return gateway_procname
+
+
+@functools.lru_cache(maxsize=1024)
+def get_gateway_matches(
+    config: PCDSConfiguration,
+    pvname: str,
+) -> tuple[tuple[str, Any], ...]:
+    """
+    Get the (gateway_procname, match) pairs from all pvlists for pvname.
+
+    Only the lowest match in each pvlist file is relevant, so only that one
+    is included for each gateway process.  Matches from old pvlists that are
+    not in use are left out.  These do not depend on the client host, so
+    they are cached to avoid re-running every pvlist pattern once per host.
+    """
+    last_matches = {}
+    for match in config.gateway_config.get_matches(pvname).matches:
+        gateway_procname = gateway_procname_from_filename(match.filename)
+        if gateway_procname is not None:
+            last_matches[gateway_procname] = match
+    return tuple(last_matches.items())
+
+
 def predict_gateway_response(
     config: PCDSConfiguration,
     pvname: str,
@@ -310,11 +470,7 @@ def predict_gateway_response(
 
     # With the subnet, we can determine which gateway rules are relevant.
     # Only the lowest down in each pvlist file is relevant.
-    for match in config.gateway_config.get_matches(pvname).matches:
-        gateway_procname = os.path.basename(match.filename).split('.')[0]
-        # Edge case: people leaving old pvlists in the config
-        if gateway_procname.endswith('old'):
-            continue
+    for gateway_procname, match in get_gateway_matches(config, pvname):
         if match.rule.command == 'DENY':
             # DENY_FROM sends a NO_ACCESS
             if hostname in match.rule.hosts:
@@ -327,21 +483,10 @@ def predict_gateway_response(
             if match.rule.access is None:
                 access = AccessBehavior.READ
             else:
-                access_group = config.access_security.groups[
-                    match.rule.access.group
-                ]
-                access = AccessBehavior.DISCONNECTED
-                for rule in access_group.rules:
-                    if rule.hosts is None:
-                        access = promote_access(access, rule.options)
-                    else:
-                        hosts = set()
-                        for host_group in rule.hosts:
-                            hosts.update(
-                                config.access_security.hosts[host_group].hosts
-                            )
-                        if hostname in hosts:
-                            access = promote_access(access, rule.options)
+                default_access, host_access = get_access_group_index(
+                    config, match.rule.access.group
+                )
+                access = host_access.get(hostname, default_access)
         else:
             raise NotImplementedError(
                 'Programmer did not know that match.rule.command could be '
@@ -355,8 +500,7 @@ def predict_gateway_response(
             pvname=pvname,
             access=access,
         )
-        # Overwrite any previous rules from that file
-        # Only the last rule matters!
+        # Only the last rule from each file was kept
         if gateway_procname.startswith(subnet):
             subnet_responses[gateway_procname] = response
         else:
@@ -449,13 +593,4 @@ def correct_gateway_pvinfo(
         access_str = new_access.name
 
     # Omit the gateway address- not in scope here
-    return PVInfo(
-        name=pvinfo.name,
-        access=access_str,
-        data_type=pvinfo.data_type,
-        data_count=pvinfo.data_count,
-        value=pvinfo.value,
-        error=pvinfo.error,
-        time_md=pvinfo.time_md,
-        control_md=pvinfo.control_md,
-    )
+    return dataclasses.replace(pvinfo, access=access_str, address=None)
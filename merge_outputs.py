@@ -2,16 +2,14 @@ import glob
 import json
 import os
 import time
-from collections import defaultdict
+from collections import Counter
 
 filenames = glob.glob('diff_*.json')
-all_data = defaultdict(int)
+all_data = Counter()
 
 for filename in filenames:
     with open(filename, 'r') as fd:
-        data = json.load(fd)
-    for key, value in data.items():
-        all_data[key] += value
+        all_data.update(json.load(fd))
 
 with open(f'merged_{int(time.time())}.json', 'w') as fd:
     json.dump(all_data, fd)